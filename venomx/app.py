@@ -1,12 +1,17 @@
-import sys, re, os, webbrowser, subprocess, threading
+import sys, re, os, time, webbrowser, subprocess, threading
 from PyQt6.QtWidgets import (
-    QMainWindow, QTabWidget, QTextEdit, QFileDialog, QMenu,
+    QApplication, QMainWindow, QTabWidget, QFileDialog, QMenu,
     QLineEdit, QVBoxLayout, QWidget, QDialog, QPushButton, QLabel, QHBoxLayout, 
     QMessageBox
 )
 from PyQt6.QtGui import QKeySequence, QTextCharFormat, QSyntaxHighlighter, QColor, QAction, QShortcut, QFont, QIcon, QTextCursor
 from PyQt6.QtCore import Qt, pyqtSlot
 from PyQt6.QtPrintSupport import QPrintDialog, QPrinter
+from profiler import profiler, EventLoopWatchdog, ProfilerOverlay
+from line_editor import CodeEditor, new_document
+from hibernation import TabHibernator, TabMemoryDialog
+from documents import DocumentRegistry
+from plugin_host import PluginHost
 
 class GoToLineDialog(QDialog):
     def __init__(self, parent=None):
@@ -37,8 +42,9 @@ class GoToLineDialog(QDialog):
             QMessageBox.warning(self, "Invalid Input", "Please enter a valid line number.")
 
 class Highlighter(QSyntaxHighlighter):
-    def __init__(self, document):
+    def __init__(self, document, plugin_host=None):
         super().__init__(document)
+        self.plugin_host = plugin_host
         self.highlighted_terms = []
         self.keywords = [
             "def", "class", "if", "else", "elif", "import", "from", "as",
@@ -61,73 +67,49 @@ class Highlighter(QSyntaxHighlighter):
             "sorted", "staticmethod", "str", "sum", "super", 
             "tuple", "type", "vars", "zip"
         ]
+        self.build_rules()
 
     def highlightBlock(self, text):
-        for function in self.builtin_functions:
-            pattern = r'\b' + re.escape(function) + r'\s*\('
-            for match in re.finditer(pattern, text):
-                length = match.end() - match.start()
-                format = QTextCharFormat()
-                format.setForeground(QColor("orange"))
-                self.setFormat(match.start(), length, format)
-
-        operators_pattern = r'(?<!\w)([+\-*/%&|^=<>!]=?|==|!=|and|or|not)(?!\w)'
-        for match in re.finditer(operators_pattern, text):
-            length = match.end() - match.start()
-            format = QTextCharFormat()
-            format.setForeground(QColor("darkgray"))
-            self.setFormat(match.start(), length, format)
-
-        annotation_pattern = r'@\w+'
-        for match in re.finditer(annotation_pattern, text):
-            length = match.end() - match.start()
-            format = QTextCharFormat()
-            format.setForeground(QColor("lightgray"))
-            self.setFormat(match.start(), length, format)
+        start = time.perf_counter_ns()
+        self.highlight_block(text)
+        profiler.record("highlightBlock", "highlight", start, time.perf_counter_ns() - start)
 
-        single_line_comment_pattern = r'#.*'
-        multi_line_comment_pattern = r"'''(.*?)'''|\"\"\"(.*?)\"\"\""
-        
-        for match in re.finditer(single_line_comment_pattern, text):
-            length = match.end() - match.start()
-            format = QTextCharFormat()
-            format.setForeground(QColor("lightgreen"))
-            self.setFormat(match.start(), length, format)
+    def highlight_block(self, text):
+        for pattern, format in self.rules:
+            for match in pattern.finditer(text):
+                self.setFormat(match.start(), match.end() - match.start(), format)
 
-        for match in re.finditer(multi_line_comment_pattern, text, flags=re.DOTALL):
-            length = match.end() - match.start()
-            format = QTextCharFormat()
-            format.setForeground(QColor("lightgreen"))
-            self.setFormat(match.start(), length, format)
-
-        for keyword in self.keywords:
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            for match in re.finditer(pattern, text, flags=re.IGNORECASE):
-                length = match.end() - match.start()
-                format = QTextCharFormat()
-                format.setForeground(QColor("blue"))
-                self.setFormat(match.start(), length, format)
-
-        string_patterns = [
-            r"'(.*?)'",
-            r'"(.*?)"',
-            r"'''(.*?)'''",
-            r'"""(.*?)"""'
-        ]
-        for pattern in string_patterns:
-            for match in re.finditer(pattern, text, flags=re.DOTALL):
-                length = match.end() - match.start()
-                format = QTextCharFormat()
-                format.setForeground(QColor("red"))
-                self.setFormat(match.start(), length, format)
+        if self.plugin_host is not None:
+            for start, length, format in self.plugin_host.highlight(self, text):
+                self.setFormat(start, length, format)
 
         for term in self.highlighted_terms:
             pattern = r'\b' + re.escape(term) + r'\b'
             for match in re.finditer(pattern, text, flags=re.IGNORECASE):
-                length = match.end() - match.start()
-                format = QTextCharFormat()
-                format.setBackground(QColor("yellow"))
-                self.setFormat(match.start(), length, format)
+                self.setFormat(match.start(), match.end() - match.start(), self.term_format)
+
+    def build_rules(self):
+        def foreground(color):
+            format = QTextCharFormat()
+            format.setForeground(QColor(color))
+            return format
+
+        string_format = foreground("red")
+        comment_format = foreground("lightgreen")
+        self.rules = [
+            (re.compile(r'\b(?:' + '|'.join(map(re.escape, self.builtin_functions)) + r')\s*\('), foreground("orange")),
+            (re.compile(r'(?<!\w)([+\-*/%&|^=<>!]=?|==|!=|and|or|not)(?!\w)'), foreground("darkgray")),
+            (re.compile(r'@\w+'), foreground("lightgray")),
+            (re.compile(r'#.*'), comment_format),
+            (re.compile(r"'''(.*?)'''|\"\"\"(.*?)\"\"\"", re.DOTALL), comment_format),
+            (re.compile(r'\b(?:' + '|'.join(map(re.escape, self.keywords)) + r')\b', re.IGNORECASE), foreground("blue")),
+            (re.compile(r"'(.*?)'", re.DOTALL), string_format),
+            (re.compile(r'"(.*?)"', re.DOTALL), string_format),
+            (re.compile(r"'''(.*?)'''", re.DOTALL), string_format),
+            (re.compile(r'"""(.*?)"""', re.DOTALL), string_format),
+        ]
+        self.term_format = QTextCharFormat()
+        self.term_format.setBackground(QColor("yellow"))
 
     def highlight_terms(self, terms):
         self.highlighted_terms = terms
@@ -177,11 +159,26 @@ class AppWindow(QMainWindow):
         self.tab_file_paths = []
         self.recent_files = []
         self.process = None
+        self.plugins = PluginHost(self)
+        self.plugins.message.connect(self.show_status_message)
+        self.plugins.discover()
+        self.documents = DocumentRegistry(self.create_highlighter, self)
+        self.documents.message.connect(self.show_status_message)
         self.setup_menu()
         self.create_button_area()
         self.python_file_tab_bar()
+        self.split_view_bar()
         self.debug_tab_bar()
+        self.profiler_overlay = ProfilerOverlay(self)
+        self.watchdog = EventLoopWatchdog()
+        self.watchdog.start()
+        self.plugins.fire_event("onStartup")
         
+    def closeEvent(self, event):
+        self.hibernator.shutdown()
+        self.plugins.shutdown()
+        super().closeEvent(event)
+
     def create_button_area(self):
         self.button_container = QWidget(self)
         self.button_layout = QHBoxLayout(self.button_container)
@@ -244,6 +241,27 @@ class AppWindow(QMainWindow):
         self.file_bar.setGeometry(40, 100, 500, 400)
         self.file_bar.setTabsClosable(True)
         self.file_bar.tabCloseRequested.connect(self.close_file_tab)
+        self.file_bar.currentChanged.connect(self.activate_tab)
+        self.hibernator = TabHibernator(self.file_bar, self.create_highlighter)
+
+    def split_view_bar(self):
+        self.split_bar = QTabWidget(self)
+        self.split_bar.setGeometry(295, 100, 245, 400)
+        self.split_editor = CodeEditor()
+        self.split_editor.highlighter = None
+        self.split_bar.addTab(self.split_editor, "")
+        self.split_bar.hide()
+        self.focused_editor = None
+        QApplication.instance().focusChanged.connect(self.track_focused_editor)
+
+    def track_focused_editor(self, old, new):
+        if new is self.split_editor or (new is not None and new is self.file_bar.currentWidget()):
+            self.focused_editor = new
+
+    def current_text_edit(self):
+        if not self.split_bar.isHidden() and self.focused_editor is self.split_editor:
+            return self.split_editor
+        return self.file_bar.currentWidget()
 
     def debug_tab_bar(self):
         debug_bar = QTabWidget(self)
@@ -405,8 +423,28 @@ class AppWindow(QMainWindow):
         view_menu.addAction(program_outline_button)
         view_menu.addAction(program_ast_ir_list_button)
         view_menu.addAction(program_stack_button)
+        performance_overlay_button = QAction("Performance Overlay", self)
+        performance_overlay_button.setCheckable(True)
+        performance_overlay_button.setShortcut(QKeySequence("Ctrl+Shift+P"))
+        performance_overlay_button.toggled.connect(self.toggle_performance_overlay)
+        record_trace_button = QAction("Record Performance Trace", self)
+        record_trace_button.setCheckable(True)
+        record_trace_button.toggled.connect(self.toggle_trace_recording)
+        export_trace_button = QAction("Export Performance Trace", self)
+        export_trace_button.triggered.connect(self.export_performance_trace)
+        split_view_button = QAction("Split View", self)
+        split_view_button.setCheckable(True)
+        split_view_button.setShortcut(QKeySequence("Ctrl+\\"))
+        split_view_button.toggled.connect(self.toggle_split_view)
+        tab_memory_button = QAction("Tab Memory Usage", self)
+        tab_memory_button.triggered.connect(self.open_tab_memory_dialog)
         view_menu.addAction(increase_font_size_button)
         view_menu.addAction(decrease_font_size_button)
+        view_menu.addAction(split_view_button)
+        view_menu.addAction(performance_overlay_button)
+        view_menu.addAction(record_trace_button)
+        view_menu.addAction(export_trace_button)
+        view_menu.addAction(tab_memory_button)
 
         run_menu = menu_bar.addMenu("Run")
         debug_program_button = QAction("Debug Program", self)
@@ -434,6 +472,9 @@ class AppWindow(QMainWindow):
         tools_menu.addAction(open_program_folder_button)
         tools_menu.addAction(settings_and_preferences_button)
 
+        plugins_menu = menu_bar.addMenu("Plugins")
+        self.plugins.populate_menu(plugins_menu)
+
         help_menu = menu_bar.addMenu("Help")
 
         version_history_button = QAction("Version History", self)
@@ -453,12 +494,22 @@ class AppWindow(QMainWindow):
 
     def create_new_file_tab(self):
         self.tab_counter += 1
-        new_tab = QTextEdit()
+        new_tab = CodeEditor()
+        new_tab.setDocument(new_document(new_tab))
         new_tab.cursorPositionChanged.connect(self.update_window_title_with_cursor_position)
         self.file_bar.addTab(new_tab, f"Tab {self.tab_counter}")
         self.tab_file_paths.append(None)
-        highlighter = Highlighter(new_tab.document())
+        self.plugins.open_language(None)
+        highlighter = self.create_highlighter(new_tab.document())
         new_tab.highlighter = highlighter
+        self.hibernator.touch(new_tab)
+        self.hibernator.enforce_budget()
+
+    def create_highlighter(self, document):
+        return Highlighter(document, self.plugins)
+
+    def show_status_message(self, message):
+        self.statusBar().showMessage(message, 5000)
 
     def update_window_title_with_cursor_position(self):
         current_index = self.file_bar.currentIndex()
@@ -471,8 +522,49 @@ class AppWindow(QMainWindow):
 
     def close_file_tab(self, index):
         if index >= 0:
+            text_edit = self.file_bar.widget(index)
             self.file_bar.removeTab(index)
             self.tab_file_paths.pop(index)
+            self.hibernator.forget(text_edit)
+            if getattr(text_edit, 'highlighter', None) is not None:
+                text_edit.highlighter.setDocument(None)
+                text_edit.highlighter = None
+            text_edit.deleteLater()
+            self.documents.release(text_edit)
+
+    def activate_tab(self, index):
+        if index >= 0:
+            text_edit = self.file_bar.widget(index)
+            self.hibernator.activate(text_edit)
+            self.documents.refresh_editor(text_edit)
+        self.update_split_view()
+
+    @pyqtSlot(bool)
+    def toggle_split_view(self, checked):
+        if checked:
+            self.file_bar.setGeometry(40, 100, 250, 400)
+            self.split_bar.show()
+            self.update_split_view()
+        else:
+            self.split_bar.hide()
+            self.file_bar.setGeometry(40, 100, 500, 400)
+            self.documents.release(self.split_editor)
+            self.split_editor.setDocument(new_document(self.split_editor))
+            self.split_editor.highlighter = None
+
+    def update_split_view(self):
+        if self.split_bar.isHidden():
+            return
+        text_edit = self.file_bar.currentWidget()
+        self.documents.release(self.split_editor)
+        if text_edit is None:
+            self.split_editor.setDocument(new_document(self.split_editor))
+            self.split_editor.highlighter = None
+            self.split_bar.setTabText(0, "")
+        else:
+            self.documents.attach(self.split_editor, text_edit.document())
+            self.split_editor.highlighter = getattr(text_edit, 'highlighter', None)
+            self.split_bar.setTabText(0, self.file_bar.tabText(self.file_bar.currentIndex()))
 
     def open_file(self):
         file_name, _ = QFileDialog.getOpenFileName(
@@ -482,23 +574,30 @@ class AppWindow(QMainWindow):
             "Python Files (*.py);;All Files (*)"
         )
         if file_name:
-            with open(file_name, 'r') as file:
-                content = file.read()
-                self.create_new_tab_with_content(content, file_name)
-                self.add_to_recent_files(file_name)
-                current_index = self.file_bar.currentIndex()
-                if current_index >= 0:
-                    text_edit = self.file_bar.widget(current_index)
-                    text_edit.cursorPositionChanged.connect(self.update_window_title_with_cursor_position)
-
-    def create_new_tab_with_content(self, content, file_name):
+            self.open_path(file_name)
+            self.add_to_recent_files(file_name)
+
+    def open_path(self, file_path):
+        entry = self.documents.find(file_path)
+        if entry is not None:
+            for index in range(self.file_bar.count()):
+                if self.file_bar.widget(index).document() is entry.document:
+                    self.file_bar.setCurrentIndex(index)
+                    return
+        self.plugins.open_language(file_path)
+        document, highlighter = self.documents.open(file_path)
+        self.create_new_tab_with_document(document, highlighter, file_path)
+
+    def create_new_tab_with_document(self, document, highlighter, file_name):
         self.tab_counter += 1
-        new_tab = QTextEdit()
-        new_tab.setPlainText(content)
+        new_tab = CodeEditor()
+        self.documents.attach(new_tab, document)
+        new_tab.highlighter = highlighter
+        new_tab.cursorPositionChanged.connect(self.update_window_title_with_cursor_position)
         self.file_bar.addTab(new_tab, file_name)
         self.tab_file_paths.append(file_name)
-        highlighter = Highlighter(new_tab.document())
-        new_tab.highlighter = highlighter
+        self.hibernator.touch(new_tab)
+        self.hibernator.enforce_budget()
 
     def save_file(self):
         current_index = self.file_bar.currentIndex()
@@ -519,6 +618,9 @@ class AppWindow(QMainWindow):
                 "Python Files (*.py);;All Files (*)"
             )
             if file_name:
+                if not self.documents.assign_path(self.file_bar.widget(current_index), file_name):
+                    QMessageBox.warning(self, "File Already Open", f"{file_name} is already open in another tab.")
+                    return
                 self.save_to_file(file_name)
                 self.tab_file_paths[current_index] = file_name
 
@@ -526,8 +628,11 @@ class AppWindow(QMainWindow):
         current_index = self.file_bar.currentIndex()
         if current_index >= 0:
             text_edit = self.file_bar.widget(current_index)
-            with open(file_path, 'w') as file:
-                file.write(text_edit.toPlainText())
+            content = text_edit.toPlainText()
+            self.plugins.run_save_hooks(file_path, content)
+            with profiler.time_block("save_to_file", "io", path=file_path), open(file_path, 'w') as file:
+                file.write(content)
+            self.documents.mark_saved(file_path)
             self.file_bar.setTabText(current_index, file_path.split('/')[-1])
 
     def print_file(self):
@@ -554,9 +659,7 @@ class AppWindow(QMainWindow):
             self.recent_files_menu.addAction(action)
 
     def open_recent_file(self, file_path):
-        with open(file_path, 'r') as file:
-            content = file.read()
-            self.create_new_tab_with_content(content, file_path)
+        self.open_path(file_path)
 
     @pyqtSlot()
     def open_find_replace_dialog(self):
@@ -568,118 +671,90 @@ class AppWindow(QMainWindow):
     @pyqtSlot(str)
     def highlight_terms(self, text):
         terms = text.split()
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
-            if hasattr(text_edit, 'highlighter'):
-                text_edit.highlighter.highlight_terms(terms)
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
+            if getattr(text_edit, 'highlighter', None) is not None:
+                with profiler.time_block("find", "find_replace"):
+                    text_edit.highlighter.highlight_terms(terms)
 
     @pyqtSlot(str, str)
     def replace_text(self, find_term, replace_term):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
-            content = text_edit.toPlainText()
-            new_content = content.replace(find_term, replace_term)
-            text_edit.setPlainText(new_content)
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
+            with profiler.time_block("replace", "find_replace"):
+                content = text_edit.toPlainText()
+                new_content = content.replace(find_term, replace_term)
+                text_edit.setPlainText(new_content)
 
     @pyqtSlot()
     def increase_font_size(self):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
             font = text_edit.font()
             font.setPointSize(font.pointSize() + 1)
             text_edit.setFont(font)
 
     @pyqtSlot()
     def decrease_font_size(self):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
             font = text_edit.font()
             font.setPointSize(max(1, font.pointSize() - 1))
             text_edit.setFont(font)
 
     def undo_action(self):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
             text_edit.undo()
 
     def redo_action(self):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
             text_edit.redo()
 
     def cut_action(self):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
             text_edit.cut()
 
     def copy_action(self):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
             text_edit.copy()
 
     def paste_action(self):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
             text_edit.paste()
 
     def comment_action(self):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
-            cursor = text_edit.textCursor()
-            if cursor.hasSelection():
-                selected_text = cursor.selectedText()
-                commented_text = '\n'.join(['# ' + line for line in selected_text.splitlines()])
-                cursor.insertText(commented_text)
-                cursor.removeSelectedText()
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
+            with profiler.time_block("comment_lines", "line_edit"):
+                text_edit.comment_lines()
 
     def uncomment_action(self):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
-            cursor = text_edit.textCursor()
-            if cursor.hasSelection():
-                selected_text = cursor.selectedText()
-                uncommented_text = '\n'.join([line[2:] if line.startswith('# ') else line for line in selected_text.splitlines()])
-                cursor.insertText(uncommented_text)
-                cursor.removeSelectedText()
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
+            with profiler.time_block("uncomment_lines", "line_edit"):
+                text_edit.uncomment_lines()
 
     def indent_action(self):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
-            cursor = text_edit.textCursor()
-            if cursor.hasSelection():
-                selected_text = cursor.selectedText()
-                indented_text = '\n'.join(['    ' + line for line in selected_text.splitlines()])
-                cursor.insertText(indented_text)
-                cursor.removeSelectedText()
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
+            with profiler.time_block("indent_lines", "line_edit"):
+                text_edit.indent_lines()
 
     def dedent_action(self):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
-            cursor = text_edit.textCursor()
-            if cursor.hasSelection():
-                selected_text = cursor.selectedText()
-                unindented_text = '\n'.join([line[4:] if line.startswith('    ') else line for line in selected_text.splitlines()])
-                cursor.insertText(unindented_text)
-                cursor.removeSelectedText()
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
+            with profiler.time_block("dedent_lines", "line_edit"):
+                text_edit.dedent_lines()
 
     @pyqtSlot(int)
     def go_to_line(self, line_number):
-        current_index = self.file_bar.currentIndex()
-        if current_index >= 0:
-            text_edit = self.file_bar.widget(current_index)
+        text_edit = self.current_text_edit()
+        if text_edit is not None:
             cursor = text_edit.textCursor()
             cursor.movePosition(QTextCursor.MoveOperation.Start)
             for _ in range(line_number - 1):
@@ -728,15 +803,45 @@ class AppWindow(QMainWindow):
             temp_file_path = os.path.join(os.getenv("TEMP"), "temp_script.py")
             with open(temp_file_path, 'w') as temp_file:
                 temp_file.write(script_content)
+            self.plugins.run_run_hooks(temp_file_path)
             self.thread = threading.Thread(target=self.run_in_thread, args=(temp_file_path,))
             self.thread.start()
 
     def run_in_thread(self, temp_file_path):
-        self.process = subprocess.Popen([sys.executable, temp_file_path])
-        self.process.wait()
+        with profiler.time_block("run_process", "process"):
+            self.process = subprocess.Popen([sys.executable, temp_file_path])
+            self.process.wait()
 
     @pyqtSlot()
     def stop_program(self):
         if self.process is not None:
-            self.process.terminate()
-            self.process = None
\ No newline at end of file
+            with profiler.time_block("stop_process", "process"):
+                self.process.terminate()
+            self.process = None
+
+    @pyqtSlot()
+    def open_tab_memory_dialog(self):
+        dialog = TabMemoryDialog(self.hibernator, self)
+        dialog.exec()
+
+    @pyqtSlot(bool)
+    def toggle_performance_overlay(self, checked):
+        self.profiler_overlay.set_visible(checked)
+
+    @pyqtSlot(bool)
+    def toggle_trace_recording(self, checked):
+        if checked:
+            profiler.start_capture()
+        else:
+            profiler.stop_capture()
+
+    @pyqtSlot()
+    def export_performance_trace(self):
+        file_name, _ = QFileDialog.getSaveFileName(
+            self, 
+            "Export Performance Trace", 
+            "venomx-trace.json", 
+            "Chrome Trace Files (*.json);;All Files (*)"
+        )
+        if file_name:
+            profiler.export_chrome_trace(file_name)
\ No newline at end of file
@@ -0,0 +1,175 @@
+import os, difflib
+from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtCore import QObject, QFileSystemWatcher, pyqtSignal
+from profiler import profiler
+from line_editor import new_document
+
+MAX_DIFF_LINES = 20000
+
+def normalize_path(path):
+    return os.path.normcase(os.path.realpath(path))
+
+def file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def split_lines(text):
+    lines = text.split('\n')
+    return [line + '\n' for line in lines[:-1]] + [lines[-1]]
+
+def apply_line_diff(document, old_text, new_text):
+    old_lines = split_lines(old_text)
+    new_lines = split_lines(new_text)
+    limit = min(len(old_lines), len(new_lines))
+    prefix = 0
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+    offsets = [sum(len(line) for line in old_lines[:prefix])]
+    old_lines = old_lines[prefix:len(old_lines) - suffix]
+    new_lines = new_lines[prefix:len(new_lines) - suffix]
+    if not old_lines and not new_lines:
+        return
+    for line in old_lines:
+        offsets.append(offsets[-1] + len(line))
+    if len(old_lines) + len(new_lines) > MAX_DIFF_LINES:
+        opcodes = [('replace', 0, len(old_lines), 0, len(new_lines))]
+    else:
+        opcodes = difflib.SequenceMatcher(None, old_lines, new_lines).get_opcodes()
+    cursor = QTextCursor(document)
+    cursor.beginEditBlock()
+    for tag, i1, i2, j1, j2 in reversed(opcodes):
+        if tag == 'equal':
+            continue
+        cursor.setPosition(offsets[i1])
+        cursor.setPosition(offsets[i2], QTextCursor.MoveMode.KeepAnchor)
+        cursor.insertText(''.join(new_lines[j1:j2]))
+    cursor.endEditBlock()
+
+class SharedDocument:
+    def __init__(self, path, document):
+        self.path = path
+        self.document = document
+        self.views = []
+        self.signature = file_signature(path)
+
+class DocumentRegistry(QObject):
+    message = pyqtSignal(str)
+
+    def __init__(self, highlighter_factory, parent=None):
+        super().__init__(parent)
+        self.highlighter_factory = highlighter_factory
+        self.entries = {}
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.file_changed)
+
+    def find(self, path):
+        return self.entries.get(normalize_path(path))
+
+    def entry_for_document(self, document):
+        for entry in self.entries.values():
+            if entry.document is document:
+                return entry
+        return None
+
+    def open(self, path):
+        key = normalize_path(path)
+        with profiler.time_block("open_file", "io", path=path), open(path, 'r') as file:
+            content = file.read()
+            document = new_document(self)
+            highlighter = self.highlighter_factory(document)
+            document.setPlainText(content)
+            document.setModified(False)
+        self.entries[key] = SharedDocument(key, document)
+        self.watcher.addPath(key)
+        return document, highlighter
+
+    def attach(self, editor, document):
+        entry = self.entry_for_document(document)
+        if entry is not None and editor not in entry.views:
+            entry.views.append(editor)
+        if editor.document() is not document:
+            editor.setDocument(document)
+
+    def release(self, editor):
+        for key, entry in list(self.entries.items()):
+            if editor in entry.views:
+                entry.views.remove(editor)
+                if not entry.views:
+                    del self.entries[key]
+                    self.watcher.removePath(key)
+                    entry.document.deleteLater()
+
+    def assign_path(self, editor, path):
+        key = normalize_path(path)
+        document = editor.document()
+        existing = self.entries.get(key)
+        if existing is not None:
+            return existing.document is document
+        entry = self.entry_for_document(document)
+        if entry is None:
+            document.setParent(self)
+            entry = SharedDocument(key, document)
+            entry.views.append(editor)
+        else:
+            del self.entries[entry.path]
+            self.watcher.removePath(entry.path)
+            entry.path = key
+        self.entries[key] = entry
+        self.watcher.addPath(key)
+        return True
+
+    def mark_saved(self, path):
+        entry = self.find(path)
+        if entry is not None:
+            entry.signature = file_signature(entry.path)
+            entry.document.setModified(False)
+            if entry.path not in self.watcher.files():
+                self.watcher.addPath(entry.path)
+
+    def file_changed(self, path):
+        entry = self.entries.get(normalize_path(path))
+        if entry is None:
+            return
+        if os.path.exists(entry.path) and entry.path not in self.watcher.files():
+            self.watcher.addPath(entry.path)
+        if all(getattr(view, 'snapshot', None) is not None for view in entry.views):
+            return
+        self.refresh(entry)
+
+    def refresh_editor(self, editor):
+        entry = self.entry_for_document(editor.document())
+        if entry is not None:
+            self.refresh(entry)
+
+    def refresh(self, entry):
+        signature = file_signature(entry.path)
+        if signature is None or signature == entry.signature:
+            return
+        entry.signature = signature
+        try:
+            with open(entry.path, 'r') as file:
+                disk_text = file.read()
+        except (OSError, UnicodeDecodeError) as error:
+            self.message.emit(f"Could not reload {entry.path}: {error}")
+            return
+        current_text = entry.document.toPlainText()
+        if disk_text == current_text:
+            return
+        if entry.document.isModified():
+            answer = QMessageBox.question(
+                self.parent(),
+                "File Changed",
+                f"{entry.path} changed on disk. Reload it and discard your unsaved changes?"
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                return
+        with profiler.time_block("reload_file", "io", path=entry.path):
+            apply_line_diff(entry.document, current_text, disk_text)
+        entry.document.setModified(False)
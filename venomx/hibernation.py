@@ -0,0 +1,245 @@
+import os, json, zlib, tempfile, itertools
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QCheckBox,
+    QTableWidget, QTableWidgetItem, QPushButton, QHeaderView
+)
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtCore import QTimer
+from profiler import profiler
+
+TEXT_BYTES_PER_CHAR = 2
+LAYOUT_BYTES_PER_BLOCK = 400
+HIGHLIGHT_BYTES_PER_BLOCK = 250
+UNDO_BYTES_PER_STEP = 200
+MAX_SPILL_CHARS = 4 * 1024 * 1024
+
+def estimate_tab_memory(editor):
+    snapshot = getattr(editor, 'snapshot', None)
+    if snapshot is not None:
+        return len(snapshot.compressed_text)
+    document = editor.document()
+    blocks = document.blockCount()
+    memory = document.characterCount() * TEXT_BYTES_PER_CHAR + blocks * LAYOUT_BYTES_PER_BLOCK
+    if getattr(editor, 'highlighter', None) is not None:
+        memory += blocks * HIGHLIGHT_BYTES_PER_BLOCK
+    return memory + document.availableUndoSteps() * UNDO_BYTES_PER_STEP
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+def document_slice(document, start, end):
+    cursor = QTextCursor(document)
+    cursor.setPosition(start)
+    cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+    return cursor.selectedText().replace('\u2029', '\n')
+
+def apply_delta(document, position, removed, inserted):
+    cursor = QTextCursor(document)
+    cursor.beginEditBlock()
+    cursor.setPosition(position)
+    cursor.setPosition(position + removed, QTextCursor.MoveMode.KeepAnchor)
+    cursor.insertText(inserted)
+    cursor.endEditBlock()
+
+class TabSnapshot:
+    def __init__(self, compressed_text, cursor_position, scroll_value, modified, undo_path=None):
+        self.compressed_text = compressed_text
+        self.cursor_position = cursor_position
+        self.scroll_value = scroll_value
+        self.modified = modified
+        self.undo_path = undo_path
+
+    def discard(self):
+        if self.undo_path and os.path.exists(self.undo_path):
+            os.remove(self.undo_path)
+        self.undo_path = None
+
+class TabHibernator:
+    def __init__(self, tab_widget, highlighter_factory, budget_mb=256, spill_undo=True, max_undo_steps=50, check_interval_ms=30000):
+        self.tab_widget = tab_widget
+        self.highlighter_factory = highlighter_factory
+        self.budget_mb = budget_mb
+        self.spill_undo = spill_undo
+        self.max_undo_steps = max_undo_steps
+        self.last_used = {}
+        self.clock = itertools.count()
+        self.timer = QTimer()
+        self.timer.setInterval(check_interval_ms)
+        self.timer.timeout.connect(self.enforce_budget)
+        self.timer.start()
+
+    def editors(self):
+        return [self.tab_widget.widget(index) for index in range(self.tab_widget.count())]
+
+    def touch(self, editor):
+        self.last_used[editor] = next(self.clock)
+
+    def forget(self, editor):
+        self.last_used.pop(editor, None)
+        snapshot = getattr(editor, 'snapshot', None)
+        if snapshot is not None:
+            snapshot.discard()
+            editor.snapshot = None
+
+    def shutdown(self):
+        self.timer.stop()
+        for editor in self.editors():
+            self.forget(editor)
+
+    def activate(self, editor):
+        if editor is None:
+            return
+        self.touch(editor)
+        if getattr(editor, 'snapshot', None) is not None:
+            self.rehydrate(editor)
+        self.enforce_budget()
+
+    def total_memory(self):
+        return sum(estimate_tab_memory(editor) for editor in self.editors())
+
+    def enforce_budget(self):
+        budget = self.budget_mb * 1024 * 1024
+        current = self.tab_widget.currentWidget()
+        editors = self.editors()
+        total = sum(estimate_tab_memory(editor) for editor in editors)
+        candidates = sorted(
+            (editor for editor in editors if editor is not current and getattr(editor, 'snapshot', None) is None),
+            key=lambda editor: self.last_used.get(editor, -1)
+        )
+        for editor in candidates:
+            if total <= budget:
+                break
+            before = estimate_tab_memory(editor)
+            self.hibernate(editor)
+            total -= before - estimate_tab_memory(editor)
+
+    def hibernate(self, editor):
+        with profiler.time_block("hibernate_tab", "memory"):
+            document = editor.document()
+            snapshot = TabSnapshot(
+                zlib.compress(document.toPlainText().encode('utf-8')),
+                editor.textCursor().position(),
+                editor.verticalScrollBar().value(),
+                document.isModified()
+            )
+            highlighter = getattr(editor, 'highlighter', None)
+            if highlighter is not None:
+                highlighter.setDocument(None)
+                highlighter.deleteLater()
+                editor.highlighter = None
+            if self.spill_undo and document.isUndoAvailable():
+                snapshot.undo_path = self.spill_undo_history(document)
+            document.setUndoRedoEnabled(False)
+            document.clear()
+            document.setUndoRedoEnabled(True)
+            editor.snapshot = snapshot
+
+    def spill_undo_history(self, document):
+        if document.characterCount() > MAX_SPILL_CHARS:
+            return None
+        changes = []
+        record_change = lambda position, removed, added: changes.append((position, removed, added))
+        document.contentsChange.connect(record_change)
+        deltas = []
+        spilled_chars = 0
+        try:
+            while document.isUndoAvailable() and len(deltas) < self.max_undo_steps:
+                document.undo()
+                changes.clear()
+                document.redo()
+                if len(changes) != 1:
+                    return None
+                position, removed, added = changes[0]
+                spilled_chars += added
+                if spilled_chars > MAX_SPILL_CHARS:
+                    break
+                deltas.append((position, removed, document_slice(document, position, position + added)))
+                document.undo()
+        finally:
+            document.contentsChange.disconnect(record_change)
+        deltas.reverse()
+        history = {"base": document.toPlainText(), "deltas": deltas}
+        file_descriptor, undo_path = tempfile.mkstemp(prefix="venomx-undo-", suffix=".json.z")
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(zlib.compress(json.dumps(history).encode('utf-8')))
+        return undo_path
+
+    def rehydrate(self, editor):
+        with profiler.time_block("rehydrate_tab", "memory"):
+            snapshot = editor.snapshot
+            editor.snapshot = None
+            document = editor.document()
+            history = None
+            if snapshot.undo_path:
+                with open(snapshot.undo_path, 'rb') as file:
+                    history = json.loads(zlib.decompress(file.read()).decode('utf-8'))
+                snapshot.discard()
+            if history:
+                document.setPlainText(history["base"])
+                for position, removed, inserted in history["deltas"]:
+                    apply_delta(document, position, removed, inserted)
+            else:
+                document.setPlainText(zlib.decompress(snapshot.compressed_text).decode('utf-8'))
+            editor.highlighter = self.highlighter_factory(document)
+            cursor = editor.textCursor()
+            cursor.setPosition(min(snapshot.cursor_position, document.characterCount() - 1))
+            editor.setTextCursor(cursor)
+            editor.verticalScrollBar().setValue(snapshot.scroll_value)
+            document.setModified(snapshot.modified)
+
+class TabMemoryDialog(QDialog):
+    def __init__(self, hibernator, parent=None):
+        super().__init__(parent)
+        self.hibernator = hibernator
+        self.setWindowTitle("Tab Memory Usage")
+        self.resize(480, 320)
+
+        layout = QVBoxLayout()
+
+        self.table = QTableWidget(0, 3, self)
+        self.table.setHorizontalHeaderLabels(["Tab", "State", "Memory"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.total_label = QLabel()
+
+        budget_layout = QHBoxLayout()
+        self.budget_spin_box = QSpinBox(self)
+        self.budget_spin_box.setRange(16, 65536)
+        self.budget_spin_box.setSuffix(" MB")
+        self.budget_spin_box.setValue(hibernator.budget_mb)
+        self.spill_check_box = QCheckBox("Spill undo history to disk", self)
+        self.spill_check_box.setChecked(hibernator.spill_undo)
+        budget_layout.addWidget(QLabel("Memory budget:"))
+        budget_layout.addWidget(self.budget_spin_box)
+        budget_layout.addWidget(self.spill_check_box)
+
+        self.apply_button = QPushButton("Apply", self)
+        self.apply_button.clicked.connect(self.apply_settings)
+
+        layout.addWidget(self.table)
+        layout.addWidget(self.total_label)
+        layout.addLayout(budget_layout)
+        layout.addWidget(self.apply_button)
+        self.setLayout(layout)
+        self.refresh()
+
+    def refresh(self):
+        tab_widget = self.hibernator.tab_widget
+        self.table.setRowCount(tab_widget.count())
+        for index in range(tab_widget.count()):
+            editor = tab_widget.widget(index)
+            state = "Hibernated" if getattr(editor, 'snapshot', None) is not None else "Active"
+            self.table.setItem(index, 0, QTableWidgetItem(tab_widget.tabText(index)))
+            self.table.setItem(index, 1, QTableWidgetItem(state))
+            self.table.setItem(index, 2, QTableWidgetItem(format_bytes(estimate_tab_memory(editor))))
+        total = self.hibernator.total_memory()
+        self.total_label.setText(f"Total: {format_bytes(total)} of {self.hibernator.budget_mb} MB budget")
+
+    def apply_settings(self):
+        self.hibernator.budget_mb = self.budget_spin_box.value()
+        self.hibernator.spill_undo = self.spill_check_box.isChecked()
+        self.hibernator.enforce_budget()
+        self.refresh()
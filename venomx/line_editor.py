@@ -0,0 +1,235 @@
+from PyQt6.QtWidgets import QPlainTextEdit, QPlainTextDocumentLayout
+from PyQt6.QtGui import QTextCursor, QTextDocument, QPainter, QColor
+from PyQt6.QtCore import Qt, QEvent
+
+INDENT = "    "
+COMMENT_PREFIX = "# "
+
+def new_document(parent=None):
+    document = QTextDocument(parent)
+    document.setDocumentLayout(QPlainTextDocumentLayout(document))
+    return document
+
+def selected_block_range(cursor):
+    document = cursor.document()
+    first = document.findBlock(cursor.selectionStart())
+    last = document.findBlock(cursor.selectionEnd())
+    if cursor.hasSelection() and last != first and cursor.selectionEnd() == last.position():
+        last = last.previous()
+    return first, last
+
+def block_ranges(block_pairs):
+    ranges = sorted((first.blockNumber(), last.blockNumber()) for first, last in block_pairs)
+    merged = []
+    for first, last in ranges:
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+        else:
+            merged.append((first, last))
+    return merged
+
+def edit_blocks(document, ranges, edit):
+    cursor = QTextCursor(document)
+    cursor.beginEditBlock()
+    for first, last in ranges:
+        block = document.findBlockByNumber(first)
+        for _ in range(last - first + 1):
+            if not block.isValid():
+                break
+            edit(cursor, block)
+            block = block.next()
+    cursor.endEditBlock()
+
+def insert_prefix(document, ranges, prefix):
+    cursor = QTextCursor(document)
+    set_position = cursor.setPosition
+    insert_text = cursor.insertText
+    cursor.beginEditBlock()
+    for first, last in ranges:
+        block = document.findBlockByNumber(first)
+        for _ in range(last - first + 1):
+            set_position(block.position())
+            insert_text(prefix)
+            block = block.next()
+    cursor.endEditBlock()
+
+def remove_span(cursor, position, length):
+    if length > 0:
+        cursor.setPosition(position)
+        cursor.setPosition(position + length, QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+
+def indent_block(cursor, block):
+    cursor.setPosition(block.position())
+    cursor.insertText(INDENT)
+
+def dedent_block(cursor, block):
+    text = block.text()
+    if text.startswith("\t"):
+        remove_span(cursor, block.position(), 1)
+    else:
+        remove_span(cursor, block.position(), len(text[:len(INDENT)]) - len(text[:len(INDENT)].lstrip(" ")))
+
+def comment_block(cursor, block):
+    cursor.setPosition(block.position())
+    cursor.insertText(COMMENT_PREFIX)
+
+def uncomment_block(cursor, block):
+    text = block.text()
+    offset = len(text) - len(text.lstrip())
+    if text.startswith(COMMENT_PREFIX, offset):
+        remove_span(cursor, block.position() + offset, len(COMMENT_PREFIX))
+    elif text.startswith("#", offset):
+        remove_span(cursor, block.position() + offset, 1)
+
+class CodeEditor(QPlainTextEdit):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.extra_cursors = []
+        self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+
+    def all_cursors(self):
+        return [self.textCursor()] + self.extra_cursors
+
+    def clear_extra_cursors(self):
+        if self.extra_cursors:
+            self.extra_cursors = []
+            self.viewport().update()
+
+    def add_cursor(self, cursor):
+        for existing in self.all_cursors():
+            if existing.position() == cursor.position():
+                return
+        self.extra_cursors.append(QTextCursor(cursor))
+        self.viewport().update()
+
+    def add_column_cursor(self, direction):
+        cursors = self.all_cursors()
+        edge = max(cursors, key=lambda c: c.blockNumber()) if direction > 0 else min(cursors, key=lambda c: c.blockNumber())
+        column = self.textCursor().positionInBlock()
+        block = edge.block().next() if direction > 0 else edge.block().previous()
+        if block.isValid():
+            cursor = QTextCursor(block)
+            cursor.setPosition(block.position() + min(column, block.length() - 1))
+            self.add_cursor(cursor)
+
+    def apply_line_edit(self, edit, prefix=None):
+        cursor = self.textCursor()
+        had_selection = cursor.hasSelection()
+        block_pairs = [selected_block_range(each) for each in self.all_cursors()]
+        first, last = block_pairs[0]
+        ranges = block_ranges(block_pairs)
+        if had_selection:
+            collapsed = QTextCursor(cursor)
+            collapsed.setPosition(first.position())
+            self.setTextCursor(collapsed)
+        if prefix is None:
+            edit_blocks(self.document(), ranges, edit)
+        else:
+            insert_prefix(self.document(), ranges, prefix)
+        if had_selection:
+            cursor.setPosition(first.position())
+            cursor.setPosition(last.position() + last.length() - 1, QTextCursor.MoveMode.KeepAnchor)
+            self.setTextCursor(cursor)
+
+    def indent_lines(self):
+        if not self.textCursor().hasSelection() and not self.extra_cursors:
+            self.textCursor().insertText(INDENT)
+        else:
+            self.apply_line_edit(indent_block, INDENT)
+
+    def dedent_lines(self):
+        self.apply_line_edit(dedent_block)
+
+    def comment_lines(self):
+        self.apply_line_edit(comment_block, COMMENT_PREFIX)
+
+    def uncomment_lines(self):
+        self.apply_line_edit(uncomment_block)
+
+    def edit_all_cursors(self, operation):
+        main = self.textCursor()
+        cursors = sorted([main] + self.extra_cursors, key=lambda c: c.position(), reverse=True)
+        main.beginEditBlock()
+        for cursor in cursors:
+            operation(cursor)
+        main.endEditBlock()
+        self.setTextCursor(main)
+        self.viewport().update()
+
+    def move_all_cursors(self, operation, mode):
+        main = self.textCursor()
+        main.movePosition(operation, mode)
+        self.setTextCursor(main)
+        for cursor in self.extra_cursors:
+            cursor.movePosition(operation, mode)
+        self.viewport().update()
+
+    def event(self, event):
+        if event.type() == QEvent.Type.ShortcutOverride and self.extra_cursors and event.key() == Qt.Key.Key_Escape:
+            event.accept()
+            return True
+        return super().event(event)
+
+    def mousePressEvent(self, event):
+        if event.modifiers() & Qt.KeyboardModifier.AltModifier and event.button() == Qt.MouseButton.LeftButton:
+            previous = self.textCursor()
+            super().mousePressEvent(event)
+            self.add_cursor(previous)
+            return
+        self.clear_extra_cursors()
+        super().mousePressEvent(event)
+
+    def keyPressEvent(self, event):
+        modifiers = event.modifiers()
+        key = event.key()
+        column_modifiers = Qt.KeyboardModifier.AltModifier | Qt.KeyboardModifier.ShiftModifier
+        if modifiers & column_modifiers == column_modifiers and key in (Qt.Key.Key_Up, Qt.Key.Key_Down):
+            self.add_column_cursor(1 if key == Qt.Key.Key_Down else -1)
+            return
+        if not self.extra_cursors:
+            super().keyPressEvent(event)
+            return
+        mode = QTextCursor.MoveMode.KeepAnchor if modifiers & Qt.KeyboardModifier.ShiftModifier else QTextCursor.MoveMode.MoveAnchor
+        movements = {
+            Qt.Key.Key_Left: QTextCursor.MoveOperation.Left,
+            Qt.Key.Key_Right: QTextCursor.MoveOperation.Right,
+            Qt.Key.Key_Up: QTextCursor.MoveOperation.Up,
+            Qt.Key.Key_Down: QTextCursor.MoveOperation.Down,
+            Qt.Key.Key_Home: QTextCursor.MoveOperation.StartOfBlock,
+            Qt.Key.Key_End: QTextCursor.MoveOperation.EndOfBlock,
+        }
+        if key == Qt.Key.Key_Escape:
+            self.clear_extra_cursors()
+        elif key in movements:
+            self.move_all_cursors(movements[key], mode)
+        elif key == Qt.Key.Key_Backspace:
+            self.edit_all_cursors(lambda c: c.removeSelectedText() if c.hasSelection() else c.deletePreviousChar())
+        elif key == Qt.Key.Key_Delete:
+            self.edit_all_cursors(lambda c: c.removeSelectedText() if c.hasSelection() else c.deleteChar())
+        elif key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self.edit_all_cursors(lambda c: c.insertBlock())
+        elif event.text() and event.text().isprintable():
+            text = event.text()
+            self.edit_all_cursors(lambda c: c.insertText(text))
+        else:
+            super().keyPressEvent(event)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.extra_cursors:
+            return
+        painter = QPainter(self.viewport())
+        for cursor in self.extra_cursors:
+            if cursor.hasSelection():
+                start = QTextCursor(cursor)
+                start.setPosition(cursor.selectionStart())
+                end = QTextCursor(cursor)
+                end.setPosition(cursor.selectionEnd())
+                start_rect = self.cursorRect(start)
+                end_rect = self.cursorRect(end)
+                if start_rect.top() == end_rect.top():
+                    painter.fillRect(start_rect.united(end_rect), QColor(51, 153, 255, 80))
+            rect = self.cursorRect(cursor)
+            painter.fillRect(rect.x(), rect.y(), 2, rect.height(), self.palette().text().color())
+        painter.end()
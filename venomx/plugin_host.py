@@ -0,0 +1,409 @@
+import os, sys, json, time, types, importlib.util, multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from PyQt6 import sip
+from PyQt6.QtWidgets import QDialog, QDockWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView
+from PyQt6.QtGui import QAction, QTextCharFormat, QColor, QFont
+from PyQt6.QtCore import Qt, QObject, pyqtSignal
+from profiler import profiler
+from documents import apply_line_diff
+
+PLUGIN_DIRECTORIES = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugins"),
+    os.path.join(os.path.expanduser("~"), ".venomx", "plugins"),
+]
+HOOK_BUDGETS_MS = {"highlight": 2, "command": 100, "save": 50, "run": 50}
+MAX_OVERRUNS = 3
+MAX_HIGHLIGHT_CACHE = 5000
+LANGUAGES = {".py": "python", ".pyw": "python"}
+PLUGIN_PACKAGE = "venomx_plugins"
+
+def load_plugin_module(name, path):
+    module_name = f"{PLUGIN_PACKAGE}.{name}"
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    if PLUGIN_PACKAGE not in sys.modules:
+        package = types.ModuleType(PLUGIN_PACKAGE)
+        package.__path__ = []
+        sys.modules[PLUGIN_PACKAGE] = package
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    if spec is None:
+        raise ImportError(f"No plugin module at {path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+def plugin_function_reference(function):
+    module = sys.modules.get(getattr(function, '__module__', None) or "")
+    if module is None or not module.__name__.startswith(PLUGIN_PACKAGE + "."):
+        return None
+    if getattr(module, getattr(function, '__qualname__', ""), None) is not function:
+        return None
+    return (module.__name__[len(PLUGIN_PACKAGE) + 1:], module.__file__, function.__qualname__)
+
+def run_plugin_function(reference, args):
+    name, path, function_name = reference
+    return getattr(load_plugin_module(name, path), function_name)(*args)
+
+def language_for_path(path):
+    return LANGUAGES.get(os.path.splitext(path or "")[1].lower(), "python" if not path else "plaintext")
+
+class PluginManifest:
+    def __init__(self, directory, data):
+        self.directory = directory
+        self.name = data["name"]
+        self.module = data.get("main", self.name)
+        self.module_path = os.path.join(directory, self.module + ".py")
+        self.activation_events = data.get("activationEvents", [])
+        contributes = data.get("contributes", {})
+        self.commands = contributes.get("commands", [])
+        self.panels = contributes.get("panels", [])
+        self.budgets = dict(HOOK_BUDGETS_MS, **data.get("budgets", {}))
+        self.allow_out_of_process = data.get("outOfProcess", True)
+        self.pure_hooks = set(data.get("pureHooks", [])) | {"highlight"}
+
+class Plugin:
+    def __init__(self, manifest):
+        self.manifest = manifest
+        self.module = None
+        self.active = False
+        self.error = None
+        self.hooks = []
+
+class Hook:
+    def __init__(self, plugin, kind, function):
+        self.plugin = plugin
+        self.kind = kind
+        self.function = function
+        self.budget_ns = plugin.manifest.budgets.get(kind, HOOK_BUDGETS_MS.get(kind, 100)) * 1000000
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.overruns = 0
+        self.out_of_process = False
+        self.disabled = False
+        self.cache = {}
+        self.pending = set()
+
+    def state(self):
+        if self.disabled:
+            return "Disabled"
+        return "Worker" if self.out_of_process else "In process"
+
+class PluginAPI:
+    def __init__(self, host, plugin):
+        self.host = host
+        self.plugin = plugin
+
+    def add_hook(self, kind, function):
+        hook = Hook(self.plugin, kind, function)
+        self.plugin.hooks.append(hook)
+        return hook
+
+    def register_command(self, command_id, callback):
+        self.host.commands[command_id] = self.add_hook("command", callback)
+
+    def register_highlighter(self, callback):
+        self.host.highlight_hooks.append(self.add_hook("highlight", callback))
+
+    def register_save_hook(self, callback):
+        self.host.save_hooks.append(self.add_hook("save", callback))
+
+    def register_run_hook(self, callback):
+        self.host.run_hooks.append(self.add_hook("run", callback))
+
+    def register_panel(self, panel_id, factory):
+        self.host.panel_factories[panel_id] = factory
+
+    def run_in_worker(self, function, *args, callback=None):
+        self.host.submit(function, args, callback, self.host.current_hook)
+
+    def current_editor(self):
+        return self.host.window.current_text_edit()
+
+    def replace_editor_text(self, editor, text, revision):
+        if sip.isdeleted(editor):
+            return False
+        document = editor.document()
+        if document.revision() != revision:
+            self.host.message.emit(f"Plugin {self.plugin.manifest.name} result was discarded because the document changed")
+            return False
+        apply_line_diff(document, editor.toPlainText(), text)
+        return True
+
+class PluginHost(QObject):
+    message = pyqtSignal(str)
+    worker_finished = pyqtSignal(object, object, object)
+
+    def __init__(self, window, move_slow_plugins_out_of_process=True):
+        super().__init__(window)
+        self.window = window
+        self.move_slow_plugins_out_of_process = move_slow_plugins_out_of_process
+        self.plugins = []
+        self.commands = {}
+        self.highlight_hooks = []
+        self.save_hooks = []
+        self.run_hooks = []
+        self.panel_factories = {}
+        self.panels = {}
+        self.fired_events = set()
+        self.formats = {}
+        self.executor = None
+        self.current_hook = None
+        self.worker_finished.connect(self.deliver_worker_result)
+
+    def discover(self):
+        for directory in PLUGIN_DIRECTORIES:
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                plugin_directory = os.path.join(directory, name)
+                manifest_path = os.path.join(plugin_directory, "plugin.json")
+                if not os.path.isfile(manifest_path):
+                    continue
+                try:
+                    with open(manifest_path, 'r') as file:
+                        manifest = PluginManifest(plugin_directory, json.load(file))
+                except (OSError, ValueError, KeyError) as error:
+                    self.message.emit(f"Could not read plugin manifest {manifest_path}: {error}")
+                    continue
+                if any(plugin.manifest.name == manifest.name for plugin in self.plugins):
+                    self.message.emit(f"Skipped plugin {manifest.name} in {plugin_directory}: a plugin with that name is already installed")
+                    continue
+                self.plugins.append(Plugin(manifest))
+
+    def populate_menu(self, menu):
+        for plugin in self.plugins:
+            for command in plugin.manifest.commands:
+                action = QAction(command.get("title", command["id"]), self.window)
+                action.triggered.connect(lambda checked, command_id=command["id"]: self.execute_command(command_id))
+                menu.addAction(action)
+            for panel in plugin.manifest.panels:
+                action = QAction(panel.get("title", panel["id"]), self.window)
+                action.triggered.connect(lambda checked, panel=panel: self.show_panel(panel["id"], panel.get("title", panel["id"])))
+                menu.addAction(action)
+        menu.addSeparator()
+        report_action = QAction("Plugin Report", self.window)
+        report_action.triggered.connect(self.show_report)
+        menu.addAction(report_action)
+
+    def fire_event(self, event):
+        if event in self.fired_events:
+            return
+        self.fired_events.add(event)
+        for plugin in self.plugins:
+            if not plugin.active and plugin.error is None and (event in plugin.manifest.activation_events or "*" in plugin.manifest.activation_events):
+                self.activate(plugin)
+
+    def activate(self, plugin):
+        with profiler.time_block(f"activate:{plugin.manifest.name}", "plugin"):
+            try:
+                plugin.module = load_plugin_module(plugin.manifest.name, plugin.manifest.module_path)
+                plugin.module.activate(PluginAPI(self, plugin))
+                plugin.active = True
+            except Exception as error:
+                plugin.error = str(error)
+                self.message.emit(f"Plugin {plugin.manifest.name} failed to activate: {error}")
+
+    def call_hook(self, hook, *args):
+        if hook.disabled:
+            return None
+        if hook.out_of_process:
+            self.submit(hook.function, args, None, hook)
+            return None
+        previous_hook = self.current_hook
+        self.current_hook = hook
+        start = time.perf_counter_ns()
+        try:
+            return hook.function(*args)
+        except Exception as error:
+            self.disable_failed_hook(hook, error)
+            return None
+        finally:
+            self.current_hook = previous_hook
+            self.account(hook, start, time.perf_counter_ns() - start)
+
+    def disable_failed_hook(self, hook, error):
+        hook.disabled = True
+        self.message.emit(f"Plugin {hook.plugin.manifest.name} {hook.kind} hook failed and was disabled: {error}")
+
+    def can_move_to_worker(self, hook):
+        manifest = hook.plugin.manifest
+        return (
+            self.move_slow_plugins_out_of_process
+            and manifest.allow_out_of_process
+            and hook.kind in manifest.pure_hooks
+            and plugin_function_reference(hook.function) is not None
+        )
+
+    def account(self, hook, start, duration):
+        hook.calls += 1
+        hook.total_ns += duration
+        hook.max_ns = max(hook.max_ns, duration)
+        profiler.record(f"{hook.plugin.manifest.name}.{hook.kind}", "plugin", start, duration)
+        if duration <= hook.budget_ns:
+            return
+        hook.overruns += 1
+        name = hook.plugin.manifest.name
+        if hook.overruns == 1:
+            self.message.emit(f"Plugin {name} {hook.kind} hook took {duration / 1000000:.1f} ms (budget {hook.budget_ns / 1000000:.0f} ms)")
+        if hook.overruns >= MAX_OVERRUNS:
+            if self.can_move_to_worker(hook):
+                hook.out_of_process = True
+                self.message.emit(f"Plugin {name} {hook.kind} hook exceeded its budget and was moved to a worker process")
+            else:
+                hook.disabled = True
+                self.message.emit(f"Plugin {name} {hook.kind} hook exceeded its budget and was disabled")
+
+    def highlight(self, highlighter, text):
+        spans = []
+        for hook in self.highlight_hooks:
+            if hook.disabled:
+                continue
+            if hook.out_of_process:
+                result = hook.cache.get(text)
+                if result is None and text not in hook.pending:
+                    hook.pending.add(text)
+                    block = highlighter.currentBlock()
+                    self.submit(hook.function, (text,), lambda result, hook=hook, text=text, block=block: self.highlight_ready(hook, text, highlighter, block, result), hook)
+            else:
+                result = self.call_hook(hook, text)
+            for start, length, style in result or ():
+                spans.append((start, length, self.format_for(style)))
+        return spans
+
+    def highlight_ready(self, hook, text, highlighter, block, result):
+        hook.pending.discard(text)
+        if len(hook.cache) >= MAX_HIGHLIGHT_CACHE:
+            hook.cache.clear()
+        hook.cache[text] = result or []
+        if not sip.isdeleted(highlighter) and highlighter.document() is not None and block.isValid() and block.text() == text:
+            highlighter.rehighlightBlock(block)
+
+    def format_for(self, style):
+        key = tuple(sorted(style.items()))
+        format = self.formats.get(key)
+        if format is None:
+            format = QTextCharFormat()
+            if "foreground" in style:
+                format.setForeground(QColor(style["foreground"]))
+            if "background" in style:
+                format.setBackground(QColor(style["background"]))
+            if style.get("bold"):
+                format.setFontWeight(QFont.Weight.Bold)
+            if style.get("underline"):
+                format.setFontUnderline(True)
+            self.formats[key] = format
+        return format
+
+    def open_language(self, path):
+        self.fire_event(f"onLanguage:{language_for_path(path)}")
+
+    def execute_command(self, command_id):
+        self.fire_event(f"onCommand:{command_id}")
+        hook = self.commands.get(command_id)
+        if hook is not None:
+            self.call_hook(hook)
+
+    def run_save_hooks(self, path, text):
+        self.fire_event("onSave")
+        for hook in self.save_hooks:
+            self.call_hook(hook, path, text)
+
+    def run_run_hooks(self, path):
+        self.fire_event("onRun")
+        for hook in self.run_hooks:
+            self.call_hook(hook, path)
+
+    def show_panel(self, panel_id, title):
+        self.fire_event(f"onPanel:{panel_id}")
+        dock = self.panels.get(panel_id)
+        if dock is None:
+            factory = self.panel_factories.get(panel_id)
+            if factory is None:
+                return
+            try:
+                widget = factory()
+            except Exception as error:
+                del self.panel_factories[panel_id]
+                self.message.emit(f"Plugin panel {panel_id} failed to open and was disabled: {error}")
+                return
+            dock = QDockWidget(title, self.window)
+            dock.setWidget(widget)
+            self.window.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, dock)
+            self.panels[panel_id] = dock
+        dock.show()
+        dock.raise_()
+
+    def submit(self, function, args, callback, hook=None):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+        reference = plugin_function_reference(function)
+        try:
+            if reference is not None:
+                future = self.executor.submit(run_plugin_function, reference, args)
+            else:
+                future = self.executor.submit(function, *args)
+        except BrokenProcessPool as error:
+            self.shutdown()
+            self.message.emit(f"Plugin worker pool stopped and will be restarted: {error}")
+            return
+        future.add_done_callback(lambda future: self.worker_finished.emit(future, callback, hook))
+
+    def deliver_worker_result(self, future, callback, hook):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.message.emit(f"Plugin worker failed: {error}")
+        elif callback is not None:
+            try:
+                callback(future.result())
+            except Exception as error:
+                if hook is None:
+                    self.message.emit(f"Plugin worker callback failed: {error}")
+                else:
+                    self.disable_failed_hook(hook, error)
+
+    def show_report(self):
+        dialog = PluginReportDialog(self, self.window)
+        dialog.exec()
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+class PluginReportDialog(QDialog):
+    def __init__(self, host, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Plugin Report")
+        self.resize(640, 300)
+
+        layout = QVBoxLayout()
+
+        rows = []
+        for plugin in host.plugins:
+            if not plugin.hooks:
+                state = f"Error: {plugin.error}" if plugin.error else ("Active" if plugin.active else "Not loaded")
+                rows.append((plugin.manifest.name, "", state, 0, 0, 0, 0))
+            for hook in plugin.hooks:
+                average_ms = hook.total_ns / hook.calls / 1000000 if hook.calls else 0
+                rows.append((plugin.manifest.name, hook.kind, hook.state(), hook.calls, average_ms, hook.max_ns / 1000000, hook.overruns))
+
+        self.table = QTableWidget(len(rows), 7, self)
+        self.table.setHorizontalHeaderLabels(["Plugin", "Hook", "State", "Calls", "Avg ms", "Max ms", "Over budget"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for row, (name, kind, state, calls, average_ms, max_ms, overruns) in enumerate(rows):
+            values = [name, kind, state, str(calls), f"{average_ms:.2f}", f"{max_ms:.2f}", str(overruns)]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+
+        layout.addWidget(self.table)
+        self.setLayout(layout)
@@ -0,0 +1,27 @@
+import re
+
+TRAILING_WHITESPACE = re.compile(r'[ \t]+$')
+
+def highlight(text):
+    match = TRAILING_WHITESPACE.search(text)
+    if match:
+        return [(match.start(), match.end() - match.start(), {"background": "#ffd6d6"})]
+    return []
+
+def strip_trailing_whitespace(text):
+    return '\n'.join(line.rstrip(' \t') for line in text.split('\n'))
+
+def activate(api):
+    api.register_highlighter(highlight)
+
+    def strip():
+        editor = api.current_editor()
+        if editor is not None:
+            revision = editor.document().revision()
+            api.run_in_worker(
+                strip_trailing_whitespace,
+                editor.toPlainText(),
+                callback=lambda text: api.replace_editor_text(editor, text, revision)
+            )
+
+    api.register_command("trailing_whitespace.strip", strip)
@@ -0,0 +1,190 @@
+import os, sys, json, time, threading, traceback
+from collections import deque
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import Qt, QTimer
+
+class BlockTimer:
+    def __init__(self, profiler, name, category, args):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.profiler.record(self.name, self.category, self.start, time.perf_counter_ns() - self.start, self.args)
+        return False
+
+class Profiler:
+    def __init__(self, max_events=10000, max_samples=50):
+        self.enabled = True
+        self.capture_requests = 0
+        self.events = deque(maxlen=max_events)
+        self.samples = deque(maxlen=max_samples)
+        self.stats = {}
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+        self.origin_ns = time.perf_counter_ns()
+
+    def time_block(self, name, category="editor", **args):
+        return BlockTimer(self, name, category, args)
+
+    def start_capture(self):
+        self.capture_requests += 1
+
+    def stop_capture(self):
+        self.capture_requests = max(0, self.capture_requests - 1)
+
+    def record(self, name, category, start_ns, duration_ns, args=None):
+        if not self.enabled:
+            return
+        with self.lock:
+            stat = self.stats.get(name)
+            if stat is None:
+                stat = self.stats[name] = [0, 0, 0]
+            stat[0] += 1
+            stat[1] += duration_ns
+            if duration_ns > stat[2]:
+                stat[2] = duration_ns
+            if not self.capture_requests:
+                return
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start_ns - self.origin_ns) / 1000,
+                "dur": duration_ns / 1000,
+                "pid": self.pid,
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            self.events.append(event)
+
+    def record_sample(self, name, category, stack, args=None):
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "i",
+            "s": "t",
+            "ts": (time.perf_counter_ns() - self.origin_ns) / 1000,
+            "pid": self.pid,
+            "tid": threading.main_thread().ident,
+            "args": dict(args or {}, stack=stack),
+        }
+        with self.lock:
+            self.samples.append(event)
+
+    def summary(self):
+        with self.lock:
+            return sorted(((name, tuple(stat)) for name, stat in self.stats.items()), key=lambda item: item[1][1], reverse=True)
+
+    def reset(self):
+        with self.lock:
+            self.events.clear()
+            self.samples.clear()
+            self.stats.clear()
+
+    def to_chrome_trace(self):
+        with self.lock:
+            events = list(self.events) + list(self.samples)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, file_path):
+        with open(file_path, 'w') as file:
+            json.dump(self.to_chrome_trace(), file)
+
+profiler = Profiler()
+
+class EventLoopWatchdog:
+    def __init__(self, threshold_ms=200, heartbeat_ms=50, sample_interval_ms=100):
+        self.threshold_ns = threshold_ms * 1000000
+        self.sample_interval = sample_interval_ms / 1000
+        self.last_beat_ns = time.perf_counter_ns()
+        self.stall_start_ns = None
+        self.lock = threading.Lock()
+        self.running = False
+        self.gui_thread_id = threading.main_thread().ident
+        self.heartbeat = QTimer()
+        self.heartbeat.setInterval(heartbeat_ms)
+        self.heartbeat.timeout.connect(self.beat)
+        self.thread = None
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.last_beat_ns = time.perf_counter_ns()
+        self.heartbeat.start()
+        self.thread = threading.Thread(target=self.watch, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self.heartbeat.stop()
+
+    def beat(self):
+        now = time.perf_counter_ns()
+        with self.lock:
+            stall_start = self.stall_start_ns
+            self.stall_start_ns = None
+            self.last_beat_ns = now
+        if stall_start is not None:
+            profiler.record("event-loop-stall", "watchdog", stall_start, now - stall_start)
+
+    def watch(self):
+        while self.running:
+            time.sleep(self.sample_interval)
+            if not profiler.enabled:
+                continue
+            with self.lock:
+                blocked_ns = time.perf_counter_ns() - self.last_beat_ns
+                if blocked_ns <= self.threshold_ns:
+                    continue
+                if self.stall_start_ns is None:
+                    self.stall_start_ns = self.last_beat_ns
+            frame = sys._current_frames().get(self.gui_thread_id)
+            if frame is not None:
+                stack = traceback.format_stack(frame)
+                profiler.record_sample("gui-blocked", "watchdog", stack, {"blocked_ms": blocked_ns / 1000000})
+
+class ProfilerOverlay(QLabel):
+    def __init__(self, parent=None, refresh_ms=500, rows=8):
+        super().__init__(parent)
+        self.rows = rows
+        self.active = False
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
+        self.setStyleSheet("background-color: rgba(0, 0, 0, 170); color: white; font-family: monospace; padding: 4px;")
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(refresh_ms)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.hide()
+
+    def set_visible(self, visible):
+        if visible == self.active:
+            return
+        self.active = visible
+        if visible:
+            profiler.start_capture()
+            self.refresh()
+            self.show()
+            self.raise_()
+            self.refresh_timer.start()
+        else:
+            self.refresh_timer.stop()
+            self.hide()
+            profiler.stop_capture()
+
+    def refresh(self):
+        lines = [f"{'name':<22}{'calls':>8}{'total ms':>11}{'max ms':>9}"]
+        for name, (count, total_ns, max_ns) in profiler.summary()[:self.rows]:
+            lines.append(f"{name[:21]:<22}{count:>8}{total_ns / 1000000:>11.1f}{max_ns / 1000000:>9.1f}")
+        self.setText("\n".join(lines))
+        self.adjustSize()
+        parent = self.parentWidget()
+        if parent is not None:
+            self.move(parent.width() - self.width() - 10, parent.height() - self.height() - 10)